@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from contextlib import contextmanager
+import io
 import logging
 import os
 from paramiko import SSHClient, SSHConfig, MissingHostKeyPolicy
@@ -20,12 +21,14 @@ import shutil
 import signal
 import socket
 import stat
+import tarfile
 import tempfile
+import time
 import warnings
 
 from ducktape.utils.http_utils import HttpMixin
 from ducktape.utils.util import wait_until
-from ducktape.errors import DucktapeError
+from ducktape.errors import DucktapeError, TimeoutError
 
 
 class RemoteAccountSSHConfig(object):
@@ -173,10 +176,14 @@ class RemoteAccount(HttpMixin):
             key_filename=self.ssh_config.identityfile,
             look_for_keys=False)
 
+        # Any sftp session belongs to the previous connection. A new one is opened lazily the next time it is needed,
+        # so accounts that only run commands never pay for the sftp subsystem.
+        if self._sftp_client:
+            self._sftp_client.close()
+            self._sftp_client = None
         if self._ssh_client:
             self._ssh_client.close()
         self._ssh_client = client
-        self._set_sftp_client()
 
     @property
     def ssh_client(self):
@@ -194,17 +201,13 @@ class RemoteAccount(HttpMixin):
 
         return self._ssh_client
 
-    def _set_sftp_client(self):
-        if self._sftp_client:
-            self._sftp_client.close()
-        self._sftp_client = self.ssh_client.open_sftp()
-
     @property
     def sftp_client(self):
+        # ssh_client tests the connection, and reconnects (discarding the current sftp session) if it was lost.
+        # Either way, the sftp session shares the same transport as ssh commands run on this account.
+        client = self.ssh_client
         if not self._sftp_client:
-            self._set_sftp_client()
-        else:
-            self.ssh_client  # test connection
+            self._sftp_client = client.open_sftp()
 
         return self._sftp_client
 
@@ -250,6 +253,46 @@ class RemoteAccount(HttpMixin):
         except Exception:
             return False
 
+    def wait_for_port(self, port, timeout=30, closed=False, initial_backoff_sec=.1, max_backoff_sec=2):
+        """Wait until a TCP connection can be established to the given port on this node.
+
+        Use this instead of sleeping for a fixed amount of time after starting (or stopping) a process. The port is
+        checked immediately; the first retry happens after initial_backoff_sec, and the delay doubles up to
+        max_backoff_sec.
+
+        The connection is attempted from the test driver, against externally_routable_ip (or ssh_hostname if that is
+        not set), not from the node itself. A port the driver cannot reach, e.g. because it is firewalled and the
+        connection attempt times out, is therefore treated as closed.
+
+        :param port: The TCP port to poll
+        :param timeout: Number of seconds to wait before giving up
+        :param closed: If True, wait until the port no longer accepts connections instead
+        :raise TimeoutError: If the port did not reach the desired state within timeout seconds
+        """
+        host = self.externally_routable_ip or self.ssh_hostname
+        end = time.time() + timeout
+        backoff_sec = initial_backoff_sec
+        while True:
+            if self._can_connect(host, port) != closed:
+                return
+            remaining = end - time.time()
+            if remaining <= 0:
+                break
+            time.sleep(min(backoff_sec, remaining))
+            backoff_sec = min(backoff_sec * 2, max_backoff_sec)
+
+        raise TimeoutError("Timed out after %s seconds waiting for port %s on %s to be %s." %
+                           (str(timeout), str(port), host, "closed" if closed else "open"))
+
+    def _can_connect(self, host, port):
+        """See if we can successfully open a TCP connection to host:port."""
+        try:
+            sock = socket.create_connection((host, port), timeout=.75)
+            sock.close()
+            return True
+        except Exception:
+            return False
+
     def ssh(self, cmd, allow_fail=False):
         """Run the given command on the remote host, and block until the command has finished running.
 
@@ -399,8 +442,7 @@ class RemoteAccount(HttpMixin):
         else:
             sig = signal.SIGKILL
 
-        for pid in pids:
-            self.signal(pid, sig, allow_fail=allow_fail)
+        self._signal_all(pids, sig, allow_fail=allow_fail)
 
     def java_pids(self, match):
         """
@@ -428,8 +470,14 @@ class RemoteAccount(HttpMixin):
         else:
             sig = signal.SIGKILL
 
-        for pid in pids:
-            self.signal(pid, sig, allow_fail=allow_fail)
+        self._signal_all(pids, sig, allow_fail=allow_fail)
+
+    def _signal_all(self, pids, sig, allow_fail=False):
+        """Send sig to all of the given processes with a single ssh command, rather than one command per process."""
+        pids = [str(pid).strip() for pid in pids]
+        pids = [pid for pid in pids if pid]
+        if pids:
+            self.signal(" ".join(pids), sig, allow_fail=allow_fail)
 
     def copy_between(self, src, dest, dest_node):
         """Copy src to dest on dest_node
@@ -588,6 +636,53 @@ class RemoteAccount(HttpMixin):
         with self.sftp_client.open(path, "w") as f:
             f.write(contents)
 
+    def create_files(self, files):
+        """Create several files at once, with the given contents.
+
+        Unlike calling create_file once per file, all the files are sent as a single tar stream over one ssh
+        command, so this costs one round trip to the remote host regardless of the number of files.
+        Missing parent directories are created. As with create_file, files are owned by the ssh user and created
+        with mode 0666 minus the remote umask, whether or not that user is root. Existing files are replaced rather
+        than written to, however, which differs from create_file in two ways:
+
+        - an existing file's mode is not kept, so e.g. an executable ``*-env.sh`` script loses its exec bit
+        - a symlink at one of the paths is replaced by a regular file instead of being written through
+
+        :param files: dict of path -> contents, where contents is a str or bytes.
+        :raise RemoteCommandError: If the files could not be extracted on the remote host
+        """
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w") as tar:
+            for path, contents in files.items():
+                if not isinstance(contents, bytes):
+                    contents = contents.encode("utf-8")
+                info = tarfile.TarInfo(path)
+                info.size = len(contents)
+                info.mode = int('666', 8)
+                info.mtime = time.time()
+                tar.addfile(info, io.BytesIO(contents))
+
+        # -P keeps absolute paths absolute; relative paths are extracted relative to the remote working directory,
+        # just as they would be by create_file. By default tar run as root would apply the archive's owner and mode
+        # verbatim, ignoring the umask; these flags make root behave like any other user.
+        cmd = "tar --no-same-owner --no-same-permissions -xPf -"
+        self._log(logging.DEBUG, "Creating files via ssh: %s" % ", ".join(files))
+
+        stdin, stdout, stderr = self.ssh_client.exec_command(cmd)
+        try:
+            stdin.write(archive.getvalue())
+            stdin.flush()
+            stdin.channel.shutdown_write()
+
+            stdout.read()
+            exit_status = stdout.channel.recv_exit_status()
+            if exit_status != 0:
+                raise RemoteCommandError(self, cmd, exit_status, stderr.read())
+        finally:
+            stdin.close()
+            stdout.close()
+            stderr.close()
+
     _DEFAULT_PERMISSIONS = int('755', 8)
 
     def mkdir(self, path, mode=_DEFAULT_PERMISSIONS):
@@ -705,7 +800,9 @@ class LogMonitor(object):
         offset recorded when the LogMonitor was created. Additional keyword args
         are passed directly to ``ducktape.utils.util.wait_until``
         """
-        return wait_until(lambda: self.acct.ssh("tail -c +%d %s | grep '%s'" % (self.offset + 1, self.log, pattern),
+        # grep -q exits on the first match without printing anything, so the remainder of the log is neither
+        # scanned nor sent back over ssh on every poll
+        return wait_until(lambda: self.acct.ssh("tail -c +%d %s | grep -q '%s'" % (self.offset + 1, self.log, pattern),
                                                 allow_fail=True) == 0, **kwargs)
 
 
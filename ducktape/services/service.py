@@ -17,6 +17,7 @@ from ducktape.command_line.defaults import ConsoleDefaults
 from ducktape.template import TemplateRenderer
 from ducktape.errors import TimeoutError
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 import shutil
 import tempfile
@@ -51,6 +52,16 @@ class Service(TemplateRenderer):
     # }
     logs = {}
 
+    # If True, per-node operations in start, stop, and clean are run concurrently across nodes rather than one node
+    # at a time. This is opt-in, since some services rely on nodes being started or stopped in order.
+    #
+    # Subclasses enabling this must make sure that start_node, stop_node, and clean_node are safe to run concurrently
+    # on different nodes.
+    parallel_node_operations = False
+
+    # Upper bound on the number of worker threads used when parallel_node_operations is True
+    max_parallel_node_operations = 32
+
     def __init__(self, context, num_nodes=None, cluster_spec=None, *args, **kwargs):
         """
         Initialize the Service.
@@ -71,6 +82,7 @@ class Service(TemplateRenderer):
         self._stop_duration_seconds = -1
         self._clean_time = -1
 
+        self._service_id = None
         self._initialized = False
         self.cluster_spec = Service.setup_cluster_spec(num_nodes=num_nodes, cluster_spec=cluster_spec)
         self.context = context
@@ -125,7 +137,15 @@ class Service(TemplateRenderer):
     @property
     def service_id(self):
         """Human-readable identifier (almost certainly) unique within a test run."""
-        return "%s-%d-%d" % (self.__class__.__name__, self._order, id(self))
+        if self._service_id is not None:
+            return self._service_id
+
+        service_id = "%s-%d-%d" % (self.__class__.__name__, self._order, id(self))
+        if self._initialized:
+            # Once registered with its context, this service's order can no longer change, so the id is computed
+            # only once rather than scanning every registered service each time it is logged
+            self._service_id = service_id
+        return service_id
 
     @property
     def _order(self):
@@ -216,7 +236,8 @@ class Service(TemplateRenderer):
             self._start_time = time.time()
 
         self.logger.debug(self.who_am_i() + ": killing processes and attempting to clean up before starting")
-        for node in self.nodes:
+
+        def stop_and_clean(node):
             # Added precaution - kill running processes, clean persistent files (if 'clean'=False flag passed,
             # skip cleaning), try/except for each step, since each of these steps may fail if there
             # are no processes to kill or no files to remove
@@ -234,10 +255,14 @@ class Service(TemplateRenderer):
             except Exception:
                 pass
 
-        for node in self.nodes:
+        self._for_each_node(stop_and_clean)
+
+        def start(node):
             self.logger.debug("%s: starting node" % self.who_am_i(node))
             self.start_node(node, **kwargs)
 
+        self._for_each_node(start)
+
         if self._start_duration_seconds < 0:
             self._start_duration_seconds = time.time() - self._start_time
 
@@ -279,10 +304,13 @@ class Service(TemplateRenderer):
         """
         self._stop_time = time.time()  # The last time stop is invoked
         self.logger.info("%s: stopping service" % self.who_am_i())
-        for node in self.nodes:
+
+        def stop(node):
             self.logger.info("%s: stopping node" % self.who_am_i(node))
             self.stop_node(node, **kwargs)
 
+        self._for_each_node(stop)
+
         self._stop_duration_seconds = time.time() - self._stop_time
 
     def stop_node(self, node, **kwargs):
@@ -295,16 +323,37 @@ class Service(TemplateRenderer):
         """
         self._clean_time = time.time()
         self.logger.info("%s: cleaning service" % self.who_am_i())
-        for node in self.nodes:
+
+        def clean(node):
             self.logger.info("%s: cleaning node" % self.who_am_i(node))
             self.clean_node(node, **kwargs)
 
+        self._for_each_node(clean)
+
     def clean_node(self, node, **kwargs):
         """Clean up persistent state on this node - e.g. service logs, configuration files etc."""
         self.logger.warn("%s: clean_node has not been overriden. "
                          "This may be fine if the service leaves no persistent state."
                          % self.who_am_i())
 
+    def _for_each_node(self, fn):
+        """Invoke fn(node) on every node of this service.
+
+        Nodes are visited one at a time in order, unless parallel_node_operations is set, in which case fn is
+        run concurrently on all nodes. In both cases, the first exception raised by fn is propagated to the caller;
+        in the concurrent case, this only happens once fn has completed on every node.
+        """
+        if not self.parallel_node_operations or len(self.nodes) <= 1:
+            for node in self.nodes:
+                fn(node)
+            return
+
+        max_workers = min(self.max_parallel_node_operations, len(self.nodes))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.service_id) as executor:
+            futures = [executor.submit(fn, node) for node in self.nodes]
+        for future in futures:
+            future.result()
+
     def free(self):
         """Free each node. This 'deallocates' the nodes so the cluster can assign them to other services."""
         for node in self.nodes:
@@ -330,7 +379,7 @@ class Service(TemplateRenderer):
         idx identifies the node within this service instance (not globally).
         """
         for idx, n in enumerate(self.nodes, 1):
-            if self.get_node(idx) == node:
+            if n == node:
                 return idx
         return -1
 
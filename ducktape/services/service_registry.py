@@ -45,42 +45,30 @@ class ServiceRegistry(object):
 
         Note that this does not clean up persistent state or free the nodes back to the cluster.
         """
-        keyboard_interrupt = None
-        for service in reversed(self._services.values()):
-            try:
-                service.stop()
-            except BaseException as e:
-                if isinstance(e, KeyboardInterrupt):
-                    keyboard_interrupt = e
-                service.logger.warn("Error stopping service %s: %s", service, e)
-
-        if keyboard_interrupt is not None:
-            raise keyboard_interrupt
+        self._call_all(reversed(self._services.values()), lambda service: service.stop(), "stopping")
 
     def clean_all(self):
         """Clean all services. This should only be called after services are stopped."""
-        keyboard_interrupt = None
-        for service in self._services.values():
-            try:
-                service.clean()
-            except BaseException as e:
-                if isinstance(e, KeyboardInterrupt):
-                    keyboard_interrupt = e
-                service.logger.warn("Error cleaning service %s: %s" % (service, e))
-
-        if keyboard_interrupt is not None:
-            raise keyboard_interrupt
+        self._call_all(self._services.values(), lambda service: service.clean(), "cleaning")
 
     def free_all(self):
         """Release nodes back to the cluster."""
+        self._call_all(self._services.values(), lambda service: service.free(), "freeing")
+
+    @staticmethod
+    def _call_all(services, fn, action):
+        """Invoke fn on each service in turn, logging rather than propagating errors so that every service is visited.
+
+        A KeyboardInterrupt is still re-raised, but only after all services have been visited.
+        """
         keyboard_interrupt = None
-        for service in self._services.values():
+        for service in services:
             try:
-                service.free()
+                fn(service)
             except BaseException as e:
                 if isinstance(e, KeyboardInterrupt):
                     keyboard_interrupt = e
-                service.logger.warn("Error cleaning service %s: %s" % (service, e))
+                service.logger.warn("Error %s service %s: %s" % (action, service, e))
 
         if keyboard_interrupt is not None:
             raise keyboard_interrupt
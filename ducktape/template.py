@@ -15,10 +15,69 @@
 from ducktape.utils.util import package_is_installed
 
 from jinja2 import Template, FileSystemLoader, PackageLoader, ChoiceLoader, Environment
+from jinja2.bccache import BytecodeCache
+import functools
 import os.path
 import inspect
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_template(source):
+    """Compile a template string. Compiled templates are reused, since the same strings are typically rendered
+    again every time a service is started."""
+    return Template(source)
+
+
+class _MemoryBytecodeCache(BytecodeCache):
+    """In-memory jinja2 bytecode cache, so that a template file is compiled once per process rather than once per
+    Environment. jinja2 checks the template source checksum before using cached bytecode, so edits are picked up.
+    As with jinja2's own bytecode caches, the key does not include Environment syntax options (e.g. trim_blocks),
+    which all renderers here share."""
+
+    def __init__(self):
+        self._bytecode = {}
+
+    def load_bytecode(self, bucket):
+        bytecode = self._bytecode.get(bucket.key)
+        if bytecode is not None:
+            bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket):
+        self._bytecode[bucket.key] = bucket.bytecode_to_string()
+
+
+_bytecode_cache = _MemoryBytecodeCache()
+
+
+@functools.lru_cache(maxsize=None)
+def _template_loader(class_dir, package, package_search_path):
+    """Return the jinja2 loader used to find template files for classes defined in class_dir.
+
+    Loaders are shared by all classes (and instances) with the same search path; each instance still gets its own
+    Environment.
+    """
+    loaders = []
+    msg = ""
+    if os.path.isdir(class_dir):
+        # FileSystemLoader overrides PackageLoader if the path containing this directory
+        # is a valid directory. FileSystemLoader throws an error from which ChoiceLoader
+        # doesn't recover if the directory is invalid
+        loaders.append(FileSystemLoader(os.path.join(class_dir, 'templates')))
+    else:
+        msg += "Will not search in %s for template files since it is not a valid directory. " % class_dir
+
+    if package_is_installed(package):
+        loaders.append(PackageLoader(package, package_search_path))
+    else:
+        msg += "Will not search in package %s for template files because it cannot be imported."
+
+    if len(loaders) == 0:
+        # Expect at least one of FileSystemLoader and PackageLoader to be present
+        raise EnvironmentError(msg)
+
+    return ChoiceLoader(loaders)
+
+
 class TemplateRenderer(object):
 
     def _get_ctx(self):
@@ -35,7 +94,7 @@ class TemplateRenderer(object):
         :return: the rendered template
         """
         if not hasattr(template, 'render'):
-            template = Template(template)
+            template = _compile_template(template)
         ctx = self._get_ctx()
         return template.render(ctx, **kwargs)
 
@@ -70,27 +129,9 @@ class TemplateRenderer(object):
             module_name = self.__class__.__module__
             package, package_search_path = self._package_search_path(module_name)
 
-            loaders = []
-            msg = ""
-            if os.path.isdir(class_dir):
-                # FileSystemLoader overrides PackageLoader if the path containing this directory
-                # is a valid directory. FileSystemLoader throws an error from which ChoiceLoader
-                # doesn't recover if the directory is invalid
-                loaders.append(FileSystemLoader(os.path.join(class_dir, 'templates')))
-            else:
-                msg += "Will not search in %s for template files since it is not a valid directory. " % class_dir
-
-            if package_is_installed(package):
-                loaders.append(PackageLoader(package, package_search_path))
-            else:
-                msg += "Will not search in package %s for template files because it cannot be imported."
-
-            if len(loaders) == 0:
-                # Expect at least one of FileSystemLoader and PackageLoader to be present
-                raise EnvironmentError(msg)
-
-            self.template_loader = ChoiceLoader(loaders)
-            self.template_env = Environment(loader=self.template_loader, trim_blocks=True, lstrip_blocks=True)
+            self.template_loader = _template_loader(class_dir, package, package_search_path)
+            self.template_env = Environment(loader=self.template_loader, trim_blocks=True, lstrip_blocks=True,
+                                            bytecode_cache=_bytecode_cache)
 
         template = self.template_env.get_template(path)
         return self.render_template(template, **kwargs)
@@ -75,6 +75,26 @@ class TestLoader(object):
         # in any discovered test, whether or not it is parametrized
         self.injected_args = injected_args
 
+    @property
+    def test_file_pattern(self):
+        """Compiled pattern which names of test files must match."""
+        return self._test_file_pattern
+
+    @test_file_pattern.setter
+    def test_file_pattern(self, pattern):
+        # Compiled once here, since it is matched against every file discovered
+        self._test_file_pattern = re.compile(pattern)
+
+    @property
+    def test_function_pattern(self):
+        """Compiled pattern which names of test functions must match."""
+        return self._test_function_pattern
+
+    @test_function_pattern.setter
+    def test_function_pattern(self, pattern):
+        # Compiled once here, since it is matched against every member of every test class discovered
+        self._test_function_pattern = re.compile(pattern)
+
     def load(self, symbols, excluded_test_symbols=None):
         """
         Discover tests specified by the symbols parameter (iterable of test symbols and/or test suite file paths).
@@ -419,7 +439,7 @@ class TestLoader(object):
 
     def _is_test_file(self, file_name):
         """By default, a test file looks like test_*.py or *_test.py"""
-        return re.match(self.test_file_pattern, os.path.basename(file_name)) is not None
+        return self.test_file_pattern.match(os.path.basename(file_name)) is not None
 
     def _is_test_class(self, obj):
         """An object is a test class if it's a leafy subclass of Test."""
@@ -433,7 +453,7 @@ class TestLoader(object):
         if not parametrized(function) and not callable(function):
             return False
 
-        return re.match(self.test_function_pattern, function.__name__) is not None
+        return self.test_function_pattern.match(function.__name__) is not None
 
     def _load_test_suite_files(self, test_suite_files):
         suites = list()
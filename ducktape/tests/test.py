@@ -433,7 +433,7 @@ class TestContext(object):
         if self.injected_args is None:
             return ""
         else:
-            params = ".".join(["%s=%s" % (k, self.injected_args[k]) for k in self.injected_args])
+            params = ".".join(["%s=%s" % (k, v) for k, v in self.injected_args.items()])
             return _escape_pathname(params)
 
     @property
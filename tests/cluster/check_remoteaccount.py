@@ -15,10 +15,15 @@
 from ducktape.errors import TimeoutError
 from tests.ducktape_mock import MockAccount
 from tests.test_utils import find_available_port
-from ducktape.cluster.remoteaccount import RemoteAccount
+from ducktape.cluster.remoteaccount import LogMonitor, RemoteAccount, RemoteCommandError
 from ducktape.cluster.remoteaccount import RemoteAccountSSHConfig
 
+import io
 import logging
+from mock import MagicMock, patch
+import pytest
+import socket
+import tarfile
 from threading import Thread
 from six.moves import SimpleHTTPServer
 from six.moves import socketserver
@@ -90,6 +95,128 @@ class CheckRemoteAccount(object):
         self.server.stop()
 
 
+class CheckWaitForPort(object):
+    def setup_method(self, _):
+        self.account = MockAccount()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(("localhost", 0))
+        self.port = self.sock.getsockname()[1]
+
+    def check_wait_for_port(self):
+        """Check that waiting returns once the port accepts connections"""
+        self.sock.listen(16)
+        self.account.wait_for_port(self.port, timeout=5)
+
+    def check_wait_for_port_timeout(self):
+        """Check that waiting on a port nobody listens on times out"""
+        start = time.time()
+        with pytest.raises(TimeoutError):
+            self.account.wait_for_port(self.port, timeout=1)
+        assert time.time() - start < 2
+
+    def check_wait_for_port_closed(self):
+        """Check that waiting for a port to close returns once the listener goes away"""
+        self.sock.listen(16)
+        with pytest.raises(TimeoutError):
+            self.account.wait_for_port(self.port, timeout=.5, closed=True)
+
+        self.sock.close()
+        self.account.wait_for_port(self.port, timeout=5, closed=True)
+
+    def teardown_method(self, _):
+        self.sock.close()
+
+
+class CheckKillProcess(object):
+    def setup_method(self, _):
+        self.account = MockAccount()
+        self.account.ssh = MagicMock(return_value=0)
+
+    def check_kill_process_single_command(self):
+        """All matching processes should be signalled with one ssh command"""
+        self.account.ssh_capture = MagicMock(return_value=iter(["123\n", "456\n"]))
+        self.account.kill_process("zookeeper")
+        self.account.ssh.assert_called_once_with("kill -15 123 456", allow_fail=False)
+
+    def check_kill_java_processes_single_command(self):
+        self.account.ssh_capture = MagicMock(return_value=iter(["123\n", "456\n"]))
+        self.account.kill_java_processes("Kafka", clean_shutdown=False, allow_fail=True)
+        self.account.ssh.assert_called_once_with("kill -9 123 456", allow_fail=True)
+
+    def check_kill_process_no_match(self):
+        """No ssh command should be issued if there is nothing to kill"""
+        self.account.ssh_capture = MagicMock(return_value=iter([]))
+        self.account.kill_process("zookeeper")
+        assert not self.account.ssh.called
+
+
+class CheckConnectionReuse(object):
+    def check_ssh_and_sftp_share_connection(self):
+        """Commands and file operations should share one ssh connection, and sftp should only be opened when used"""
+        with patch("ducktape.cluster.remoteaccount.SSHClient") as ssh_client_cls:
+            client = ssh_client_cls.return_value
+            client.exec_command.return_value = (MagicMock(), MagicMock(), MagicMock())
+            client.exec_command.return_value[1].channel.recv_exit_status.return_value = 0
+
+            account = MockAccount()
+            account.ssh("mkdir -p /mnt/foo")
+            assert not client.open_sftp.called
+
+            account.create_file("/mnt/foo/bar", "contents")
+            account.ssh("cat /mnt/foo/bar")
+            account.create_file("/mnt/foo/baz", "contents")
+
+            assert client.connect.call_count == 1
+            assert client.open_sftp.call_count == 1
+
+
+class CheckCreateFiles(object):
+    def check_create_files_single_command(self):
+        """All files should be sent as one tar stream over a single ssh command"""
+        with patch("ducktape.cluster.remoteaccount.SSHClient") as ssh_client_cls:
+            client = ssh_client_cls.return_value
+            stdin, stdout, stderr = MagicMock(), MagicMock(), MagicMock()
+            client.exec_command.return_value = (stdin, stdout, stderr)
+            stdout.channel.recv_exit_status.return_value = 0
+
+            MockAccount().create_files({"/mnt/a.properties": "a=1", "/mnt/b.properties": b"b=2"})
+
+            client.exec_command.assert_called_once_with("tar --no-same-owner --no-same-permissions -xPf -")
+            assert not client.open_sftp.called
+            sent = b"".join(call[0][0] for call in stdin.write.call_args_list)
+            with tarfile.open(fileobj=io.BytesIO(sent)) as tar:
+                assert tar.extractfile("/mnt/a.properties").read() == b"a=1"
+                assert tar.extractfile("/mnt/b.properties").read() == b"b=2"
+
+    def check_create_files_failure(self):
+        """A non-zero exit status from tar should raise, and the channel should still be closed"""
+        with patch("ducktape.cluster.remoteaccount.SSHClient") as ssh_client_cls:
+            client = ssh_client_cls.return_value
+            stdin, stdout, stderr = MagicMock(), MagicMock(), MagicMock()
+            client.exec_command.return_value = (stdin, stdout, stderr)
+            stdout.channel.recv_exit_status.return_value = 2
+            stderr.read.return_value = "tar: /mnt/a.properties: Cannot open: Permission denied"
+
+            with pytest.raises(RemoteCommandError) as exc_info:
+                MockAccount().create_files({"/mnt/a.properties": "a=1"})
+
+            assert exc_info.value.exit_status == 2
+            assert "Permission denied" in str(exc_info.value)
+            stdin.close.assert_called_once_with()
+            stdout.close.assert_called_once_with()
+            stderr.close.assert_called_once_with()
+
+
+class CheckLogMonitor(object):
+    def check_wait_until_stops_at_first_match(self):
+        """Polling the log should stop reading at the first match rather than returning every matching line"""
+        account = MockAccount()
+        account.ssh = MagicMock(return_value=0)
+
+        LogMonitor(account, "/mnt/service.log", 10).wait_until("started", timeout_sec=1)
+        account.ssh.assert_called_once_with("tail -c +11 /mnt/service.log | grep -q 'started'", allow_fail=True)
+
+
 class CheckRemoteAccountEquality(object):
 
     def check_remote_account_equality(self):
@@ -195,6 +195,29 @@ class CheckTestLoader(object):
         tests = loader.load([discover_dir()])
         assert len(tests) == num_tests_in_dir(discover_dir())
 
+    def check_test_loader_patterns(self):
+        """Check that name patterns are compiled on assignment, whether given as strings or compiled patterns."""
+        loader = TestLoader(self.SESSION_CONTEXT, logger=Mock())
+        assert loader._is_test_file("/path/to/test_a.py")
+        assert loader._is_test_file("/path/to/a_test.py")
+        assert not loader._is_test_file("/path/to/a.py")
+
+        loader.test_file_pattern = r"^check_.*\.py$"
+        assert loader.test_file_pattern.pattern == r"^check_.*\.py$"
+        assert loader._is_test_file("/path/to/check_a.py")
+        assert not loader._is_test_file("/path/to/test_a.py")
+
+        loader.test_function_pattern = re.compile("^check")
+
+        def check_something():
+            pass
+
+        def test_something():
+            pass
+
+        assert loader._is_test_function(check_something)
+        assert not loader._is_test_function(test_something)
+
     def check_test_loader_with_file(self):
         """Check discovery on a file. """
         loader = TestLoader(self.SESSION_CONTEXT, logger=Mock())
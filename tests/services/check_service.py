@@ -13,9 +13,13 @@
 # limitations under the License.
 
 from ducktape.services.service import Service
+from ducktape.services.service_registry import ServiceRegistry
 from tests.ducktape_mock import test_context, session_context
 from ducktape.cluster.localhost import LocalhostCluster
 
+from mock import MagicMock
+import threading
+
 
 class DummyService(Service):
     """Simple fake service class."""
@@ -49,6 +53,28 @@ class DummyService(Service):
         self.stopped_kwargs = kwargs
 
 
+class ParallelDummyService(Service):
+    """Fake service whose per-node operations only complete if they run concurrently on every node."""
+    parallel_node_operations = True
+
+    def __init__(self, context, num_nodes):
+        super(ParallelDummyService, self).__init__(context, num_nodes)
+        self.barrier = threading.Barrier(num_nodes, timeout=5)
+        self.started_nodes = []
+        self.stopped_nodes = []
+
+    def start_node(self, node, **kwargs):
+        self.barrier.wait()
+        self.started_nodes.append(node)
+
+    def stop_node(self, node, **kwargs):
+        self.barrier.wait()
+        self.stopped_nodes.append(node)
+
+    def clean_node(self, node, **kwargs):
+        self.barrier.wait()
+
+
 class DifferentDummyService(Service):
     """Another fake service class."""
 
@@ -94,6 +120,24 @@ class CheckAllocateFree(object):
         assert self.diffDummy1._order == 1
         assert self.diffDummy2._order == 2
 
+    def check_idx(self):
+        """Check that idx returns the 1-based position of a node within the service, or -1 for foreign nodes"""
+        service = ParallelDummyService(self.context, 3)
+        other = ParallelDummyService(self.context, 1)
+        assert [service.idx(node) for node in service.nodes] == [1, 2, 3]
+        assert service.idx(other.nodes[0]) == -1
+
+    def check_service_id(self):
+        """Check that service_id reflects the order of the service and does not change as more services register"""
+        self.dummy0 = DummyService(self.context, 1)
+        self.dummy1 = DummyService(self.context, 1)
+        service_id = self.dummy1.service_id
+        assert service_id == "DummyService-1-%d" % id(self.dummy1)
+
+        self.dummy2 = DummyService(self.context, 1)
+        assert self.dummy1.service_id == service_id
+        assert self.dummy2.service_id == "DummyService-2-%d" % id(self.dummy2)
+
 
 class CheckStartStop(object):
 
@@ -139,3 +183,33 @@ class CheckStartStop(object):
         assert service.stopped_kwargs == kwargs
         service.clean(**kwargs)
         assert service.cleaned_kwargs == kwargs
+
+    def check_parallel_node_operations(self):
+        """Check that start and stop run per-node operations concurrently when parallel_node_operations is set"""
+        service = ParallelDummyService(self.context, 3)
+
+        service.start()
+        assert len(service.started_nodes) == 3
+        assert not service.barrier.broken
+
+        service.stop()
+        assert len(service.stopped_nodes) == 6
+        assert not service.barrier.broken
+        assert set(service.stopped_nodes) == set(service.nodes)
+
+
+class CheckServiceRegistry(object):
+
+    def check_stop_all_visits_every_service(self):
+        """Check that stop_all stops services in reverse order, and keeps going if one of them fails"""
+        stopped = []
+        registry = ServiceRegistry()
+        services = [MagicMock(nodes=[]) for _ in range(3)]
+        for service in services:
+            service.stop.side_effect = lambda s=service: stopped.append(s)
+            registry.append(service)
+        services[1].stop.side_effect = RuntimeError("failed to stop")
+
+        registry.stop_all()
+        assert stopped == [services[2], services[0]]
+        assert services[1].logger.warn.called
@@ -39,6 +39,21 @@ class CheckTemplateRenderingService(object):
     def check_file_template(self):
         self.new_instance().render_file_template()
 
+    def check_class_attribute_added_later(self):
+        self.new_instance().render_class_attribute_added_later()
+
+    def check_template_environment_per_instance(self):
+        """Instances share the template loader, but changes to one instance's environment must not leak into others"""
+        first, second = self.new_instance(), self.new_instance()
+        first.render_file_template()
+        second.render_file_template()
+        assert first.template_loader is second.template_loader
+        assert first.template_env is not second.template_env
+
+        first.template_env.filters["shout"] = lambda value: value.upper()
+        assert "shout" not in second.template_env.filters
+        second.render_file_template()
+
 
 class TemplateRenderingService(Service):
     NO_VARIABLE = "fixed content"
@@ -72,3 +87,13 @@ class TemplateRenderingService(Service):
     def render_file_template(self):
         self.a_field = "world"
         assert "Sample world" == self.render("sample")
+
+    def render_class_attribute_added_later(self):
+        """Test that class attributes added after the first render are available to later renders"""
+        template = "{{ CLASS_CONSTANT }}-{{ LATE_CONSTANT }}"
+        assert self.render_template(template) == "constant-"
+        TemplateRenderingService.LATE_CONSTANT = "late"
+        try:
+            assert self.render_template(template) == "constant-late"
+        finally:
+            del TemplateRenderingService.LATE_CONSTANT